@@ -0,0 +1,743 @@
+import functools
+import json
+import os
+import re
+import sys
+import time
+import traceback
+import shutil
+import subprocess
+import threading
+
+# Set ffmpeg path - cross-platform support
+if sys.platform == 'win32':
+    # Windows: Use local ffmpeg if available
+    # The bundled ffmpeg sits next to the entry scripts, one level above this package
+    ffmpeg_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              'ffmpeg', 'ffmpeg-8.0.1-essentials_build', 'bin')
+    if os.path.exists(ffmpeg_dir):
+        os.environ['PATH'] = ffmpeg_dir + os.pathsep + os.environ.get('PATH', '')
+elif sys.platform == 'darwin':
+    # macOS: Check for Homebrew installation
+    homebrew_paths = ['/opt/homebrew/bin', '/usr/local/bin']
+    for path in homebrew_paths:
+        if os.path.exists(os.path.join(path, 'ffmpeg')):
+            os.environ['PATH'] = path + os.pathsep + os.environ.get('PATH', '')
+            break
+    else:
+        # If ffmpeg not found, check if it's already in PATH
+        if not shutil.which('ffmpeg'):
+            print("Warning: ffmpeg not found. Install with: brew install ffmpeg")
+else:
+    # Linux: Check common installation paths
+    if not shutil.which('ffmpeg'):
+        print("Warning: ffmpeg not found. Install with:")
+        print("  Ubuntu/Debian: sudo apt install ffmpeg")
+        print("  Fedora: sudo dnf install ffmpeg")
+        print("  Arch Linux: sudo pacman -S ffmpeg")
+
+from PyQt6.QtWidgets import (
+    QApplication, QWidget, QVBoxLayout, QPushButton, QFileDialog,
+    QProgressBar, QLabel, QCheckBox, QHBoxLayout, QComboBox, QTextEdit
+)
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThread, QThreadPool, pyqtSignal
+
+# Upper bound on how many files a single ffmpeg process converts
+_BATCH_SIZE = 8
+
+# How many batches per pool thread the folder scan may queue ahead
+_QUEUED_BATCHES_PER_THREAD = 4
+
+# Conversions run ffmpeg as a child process, so worker threads spend their
+# time blocked in subprocess with the GIL released and scale across cores.
+def _run_ffmpeg(cmd):
+    try:
+        subprocess.run(cmd, check=True, capture_output=True, text=True, errors='replace')
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"ffmpeg exited with code {e.returncode}: {e.stderr.strip()}") from e
+
+# Returns the first audio stream as reported by ffprobe, or {} if there is none
+def _probe_audio(file_path):
+    result = subprocess.run(
+        ['ffprobe', '-v', 'error', '-select_streams', 'a:0', '-show_streams', '-of', 'json', file_path],
+        check=True, capture_output=True, text=True, errors='replace'
+    )
+    streams = json.loads(result.stdout).get('streams', [])
+    return streams[0] if streams else {}
+
+# Failures are collected during a batch and appended in one go at the end, so
+# the log is opened once and parallel workers never interleave their entries
+def _write_error_log(log_path, entries):
+    if entries:
+        with open(log_path, 'a') as log_file:
+            log_file.writelines(entries)
+
+def _iter_audio_files(folder, exts):
+    # Walk with os.scandir directly: the entry type comes back with the listing,
+    # so no per-file stat is needed (expensive on OneDrive/SharePoint paths)
+    pending = [folder]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            # Skip unreadable folders, as os.walk does
+            continue
+        with entries:
+            while True:
+                # Like os.walk, stop listing a folder that errors part-way and
+                # treat entries whose type can't be read as files
+                try:
+                    entry = next(entries)
+                except StopIteration:
+                    break
+                except OSError:
+                    break
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    pending.append(entry.path)
+                elif entry.name.endswith(exts):
+                    yield entry.path
+
+# soxr resamples faster and cleaner than ffmpeg's built-in swr resampler, but
+# only builds configured with --enable-libsoxr have it
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_has_soxr():
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-buildconf'],
+                                check=True, capture_output=True, text=True, errors='replace')
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return '--enable-libsoxr' in result.stdout
+
+# Encoder options for one output. The target rate and layout are always
+# requested: ffmpeg only inserts a resample/rematrix step when the decoded
+# stream differs, so files that already match pass through untouched without
+# having to probe them first.
+def _output_args(opts):
+    args = ['-af', 'aresample=resampler=soxr'] if _ffmpeg_has_soxr() else []
+    if opts['gamma_horizon']:
+        return args + ['-ar', '8000', '-ac', '1', '-acodec', 'pcm_mulaw', '-f', 'wav']
+    return args + ['-ar', str(opts['sample_rate']), '-ac', '2', '-b:a', opts['bitrate'], '-f', 'mp3']
+
+def _output_path(file_path, opts):
+    if opts['overwrite']:
+        return file_path
+    relative_path = os.path.relpath(file_path, opts['folder'])
+    output_path = os.path.join(opts['destination_folder'], relative_path)
+    # Create each destination folder once per run instead of asking the
+    # filesystem for every file. Workers share the set; a race only costs a
+    # redundant makedirs.
+    output_dir = os.path.dirname(output_path)
+    if output_dir not in opts['created_dirs']:
+        os.makedirs(output_dir, exist_ok=True)
+        opts['created_dirs'].add(output_dir)
+    return os.path.splitext(output_path)[0] + ('.wav' if opts['gamma_horizon'] else '.mp3')
+
+# Flushes a finished file to disk before renaming it over its final name, so a
+# crash or power loss leaves either the old file or the complete new one.
+# 'r+b' (not 'ab') so a missing part file raises instead of being created empty.
+def _commit_output(part_path, output_path):
+    with open(part_path, 'r+b') as f:
+        os.fsync(f.fileno())
+    os.replace(part_path, output_path)
+
+def _error_entry(file_path, e):
+    return f"{file_path} - {str(e)}\n{traceback.format_exc()}\n"
+
+# Encodes every (input, output) job in a single ffmpeg process using one
+# -i per input and a -map/-map_metadata pair per output. Each output goes to
+# a .part file next to it; the caller commits them one by one, which also lets
+# overwrite mode replace the file ffmpeg is reading from.
+def _transcode(jobs, opts):
+    targets = [output_path + '.part' for _, output_path in jobs]
+    # -nostdin keeps parallel ffmpeg instances from reading the console, and
+    # -loglevel error keeps the banner and stream dump out of logged errors
+    cmd = ['ffmpeg', '-nostdin', '-hide_banner', '-loglevel', 'error', '-y']
+    for file_path, _ in jobs:
+        cmd += ['-i', file_path]
+    for i, target_path in enumerate(targets):
+        cmd += ['-map', f'{i}:a:0', '-map_metadata', str(i)] + _output_args(opts) + [target_path]
+    try:
+        _run_ffmpeg(cmd)
+    except Exception:
+        # Don't leave partial outputs behind for the next run to skip
+        for target_path in targets:
+            if os.path.exists(target_path):
+                os.remove(target_path)
+        raise
+    return targets
+
+# Cheap header sniff: a RIFF/WAVE header for Gamma Horizon output, otherwise an
+# ID3 tag or an MPEG audio frame sync
+def _looks_like_target(file_path, opts):
+    try:
+        with open(file_path, 'rb') as f:
+            header = f.read(12)
+    except OSError:
+        return False
+    if opts['gamma_horizon']:
+        return header[:4] == b'RIFF' and header[8:12] == b'WAVE'
+    return header[:3] == b'ID3' or (len(header) >= 2 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0)
+
+# In overwrite mode the output keeps the source's name, so a re-run meets files
+# an earlier run already converted. Copying them would be a no-op and
+# re-encoding would only lose quality, so they are skipped without decoding.
+def _already_converted(file_path, opts):
+    # Genuine .flac/.m4a/.wv sources are ruled out from the first bytes, so
+    # ffprobe only starts for files that already look like the target format
+    if not _looks_like_target(file_path, opts):
+        return False
+    try:
+        stream = _probe_audio(file_path)
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        # Let the conversion itself report unreadable files
+        return False
+    actual = (stream.get('codec_name'), stream.get('sample_rate'), stream.get('channels'))
+    if opts['gamma_horizon']:
+        return actual == ('pcm_mulaw', '8000', 1)
+    bit_rate = str(int(opts['bitrate'].rstrip('k')) * 1000)
+    return actual == ('mp3', str(opts['sample_rate']), 2) and stream.get('bit_rate') == bit_rate
+
+# Returns (file_path, error log entry or '') for every file in the batch
+def _convert_batch(file_paths, opts):
+    results = []
+    jobs = []
+    for file_path in file_paths:
+        try:
+            output_path = _output_path(file_path, opts)
+        except Exception as e:
+            results.append((file_path, _error_entry(file_path, e)))
+            continue
+        if opts['overwrite']:
+            if _already_converted(file_path, opts):
+                results.append((file_path, ''))
+            else:
+                jobs.append((file_path, output_path))
+            continue
+        if os.path.exists(output_path):
+            results.append((file_path, ''))
+            continue
+        # Sources that only differ by extension map to the same output. Batches
+        # run in parallel, so claims are tracked for the whole run and only the
+        # first source converts; the claim is released again if it fails.
+        with opts['claim_lock']:
+            claimant = opts['claimed_outputs'].setdefault(output_path, file_path)
+        if claimant == file_path:
+            jobs.append((file_path, output_path))
+        else:
+            # Not a success: the output may still fail, so it must not reach
+            # the resume manifest
+            results.append((file_path, f"{file_path} - skipped: {output_path} is converted from {claimant}\n\n"))
+
+    results += _convert_jobs(jobs, opts)
+    if not opts['overwrite']:
+        failed = {file_path for file_path, error in results if error}
+        with opts['claim_lock']:
+            for file_path, output_path in jobs:
+                if file_path in failed:
+                    del opts['claimed_outputs'][output_path]
+    return results
+
+def _convert_jobs(jobs, opts):
+    results = []
+    if len(jobs) > 1:
+        try:
+            targets = _transcode(jobs, opts)
+        except Exception:
+            # One bad input fails the whole process, so fall through and
+            # retry file by file to find out which one it was
+            pass
+        else:
+            # ffmpeg succeeded, so every job is done apart from its own commit;
+            # nothing is encoded again from here on
+            for job, target_path in zip(jobs, targets):
+                results.append(_commit_job(job, target_path))
+            return results
+
+    for job in jobs:
+        try:
+            target_path = _transcode([job], opts)[0]
+        except Exception as e:
+            results.append((job[0], _error_entry(job[0], e)))
+        else:
+            results.append(_commit_job(job, target_path))
+    return results
+
+def _commit_job(job, target_path):
+    file_path, output_path = job
+    try:
+        _commit_output(target_path, output_path)
+    except Exception as e:
+        if os.path.exists(target_path):
+            os.remove(target_path)
+        return (file_path, _error_entry(file_path, e))
+    return (file_path, '')
+
+# Records converted inputs while a batch runs, one JSON line each, so a run
+# that crashes resumes where it stopped instead of starting over. Entries
+# only count for a run with the same settings, and the file is removed once
+# the batch completes.
+class ConversionManifest:
+    NAME = '.audioconv_manifest.jsonl'
+
+    def __init__(self, folder, settings):
+        self.path = os.path.join(folder, self.NAME)
+        self.settings = settings
+        self.completed = set()
+        try:
+            with open(self.path, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # The last line may have been cut short by the crash
+                        continue
+                    if entry.get('settings') == settings:
+                        self.completed.add(entry.get('input'))
+        except FileNotFoundError:
+            pass
+        self.file = open(self.path, 'a', encoding='utf-8')
+
+    def record(self, file_paths):
+        for file_path in file_paths:
+            self.file.write(json.dumps({'input': file_path, 'settings': self.settings}) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            # Already removed by another run, or held open by a sync client;
+            # a leftover manifest only causes a harmless resume next time
+            pass
+
+# QRunnable is not a QObject, so the tasks emit through a signals object
+# owned by the GUI thread; the slots then run there as queued calls.
+class ScanSignals(QObject):
+    found = pyqtSignal(list)
+    finished = pyqtSignal(int)
+
+class ScanTask(QRunnable):
+    def __init__(self, folder, file_types, skip, ramp_up, batch_slots, signals):
+        super().__init__()
+        self.folder = folder
+        self.file_types = file_types
+        self.skip = skip
+        self.ramp_up = ramp_up
+        # One slot per batch handed over; the GUI thread releases it when the
+        # batch is done, so at most a fixed number of batches are ever queued
+        self.batch_slots = batch_slots
+        self.stopped = False
+        self.signals = signals
+
+    def hand_over(self, batch):
+        # Wait for a free slot, but give up if the app is closing
+        while not self.batch_slots.acquire(timeout=0.1):
+            if self.stopped:
+                return False
+        self.signals.found.emit(batch)
+        return True
+
+    def run(self):
+        # Hand files over while the walk is still going instead of collecting
+        # the whole tree first. The first ramp_up files go out one at a time
+        # so every pool thread starts converting straight away; after that
+        # they are grouped so each ffmpeg start is shared by several files.
+        batch = []
+        total = 0
+        for file_path in _iter_audio_files(self.folder, tuple(self.file_types)):
+            if file_path in self.skip:
+                continue
+            batch.append(file_path)
+            total += 1
+            if total <= self.ramp_up or len(batch) == _BATCH_SIZE:
+                if not self.hand_over(batch):
+                    return
+                batch = []
+        if batch and not self.hand_over(batch):
+            return
+        self.signals.finished.emit(total)
+
+class ConvertSignals(QObject):
+    batch_done = pyqtSignal(list)
+
+class ConvertTask(QRunnable):
+    def __init__(self, file_paths, opts, signals):
+        super().__init__()
+        self.file_paths = file_paths
+        self.opts = opts
+        self.signals = signals
+
+    def run(self):
+        self.signals.batch_done.emit(_convert_batch(self.file_paths, self.opts))
+
+# Cue sheet command handlers, dispatched on the first token of each line.
+# The track being parsed is always tracks[-1]; album-level TITLE/PERFORMER
+# lines before the first TRACK are ignored.
+_CUE_INDEX_01 = re.compile(r'01\s+(\d+):(\d+):(\d+)')
+
+def _cue_track(tracks, args):
+    tracks.append({'number': int(args.split(None, 1)[0])})
+
+def _cue_title(tracks, args):
+    if tracks:
+        tracks[-1]['title'] = args.strip('"')
+
+def _cue_performer(tracks, args):
+    if tracks:
+        tracks[-1]['performer'] = args.strip('"')
+
+def _cue_index(tracks, args):
+    match = _CUE_INDEX_01.match(args)
+    if match and tracks:
+        minutes, seconds, frames = map(int, match.groups())
+        # Keep cue frames (1/75 s) as the native unit; convert once when cutting
+        tracks[-1]['start_frames'] = (minutes * 60 + seconds) * 75 + frames
+
+_CUE_HANDLERS = {
+    'TRACK': _cue_track,
+    'TITLE': _cue_title,
+    'PERFORMER': _cue_performer,
+    'INDEX': _cue_index,
+}
+
+class CueSplitterThread(QThread):
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(list)
+
+    # Anything other than letters, digits, spaces, '-' and '_' is dropped from
+    # track titles; \w is Unicode-aware, so accented titles survive
+    _UNSAFE_FILENAME_CHARS = re.compile(r'[^\w \-]')
+
+    def __init__(self, cue_file, audio_file, output_folder):
+        super().__init__()
+        self.cue_file = cue_file
+        self.audio_file = audio_file
+        self.output_folder = output_folder
+        self.failed_files = []
+
+    def parse_cue(self):
+        try:
+            return self.parse_cue_lines('utf-8')
+        except UnicodeDecodeError:
+            return self.parse_cue_lines('latin-1')
+
+    def parse_cue_lines(self, encoding):
+        tracks = []
+        with open(self.cue_file, 'r', encoding=encoding) as f:
+            for line in f:
+                parts = line.split(None, 1)
+                if parts:
+                    handler = _CUE_HANDLERS.get(parts[0])
+                    if handler:
+                        handler(tracks, parts[1].strip() if len(parts) > 1 else '')
+        return tracks
+
+    def run(self):
+        errors = []
+        try:
+            # Normalize paths for OneDrive/SharePoint
+            self.cue_file = os.path.normpath(self.cue_file)
+            self.audio_file = os.path.normpath(self.audio_file)
+            self.output_folder = os.path.normpath(self.output_folder)
+            
+            # Verify files exist
+            if not os.path.exists(self.cue_file):
+                raise FileNotFoundError(f"Cue file not found: {self.cue_file}")
+            if not os.path.exists(self.audio_file):
+                raise FileNotFoundError(f"Audio file not found: {self.audio_file}")
+            if not os.path.exists(self.output_folder):
+                os.makedirs(self.output_folder, exist_ok=True)
+            
+            tracks = self.parse_cue()
+            # A track without INDEX 01 has no start: report it on its own and
+            # split the rest (its audio stays with the previous track)
+            for track in tracks:
+                if 'start_frames' not in track:
+                    self.failed_files.append(f"Track {track.get('number', 'unknown')}: no INDEX 01 in cue sheet")
+                    errors.append(f"Track {track.get('number', 'unknown')} - no INDEX 01 in cue sheet\n\n")
+            tracks = [track for track in tracks if 'start_frames' in track]
+            if not tracks:
+                raise ValueError(f"No tracks with an INDEX 01 found in cue file: {self.cue_file}")
+            starts = [track['start_frames'] * 1000 // 75 for track in tracks]
+            total_tracks = len(tracks)
+
+            for i, track in enumerate(tracks):
+                part_path = None
+                try:
+                    track_num = str(track['number']).zfill(2)
+                    title = track.get('title', f'Track {track_num}')
+                    # Sanitize filename
+                    title = self._UNSAFE_FILENAME_CHARS.sub('', title).strip()
+                    filename = f"{track_num} - {title}.flac"
+                    output_path = os.path.join(self.output_folder, filename)
+                    part_path = output_path + '.part'
+                    
+                    # Cut each track straight from the album file instead of
+                    # decoding it into memory. Input seeking while encoding cuts at
+                    # the exact cue time (to the ms), and every track is encoded to
+                    # FLAC (even from FLAC) so its header carries its own
+                    # length and MD5 rather than the album's.
+                    cmd = ['ffmpeg', '-nostdin', '-hide_banner', '-loglevel', 'error', '-y',
+                           '-ss', f'{starts[i] / 1000:.3f}', '-i', self.audio_file]
+                    if i + 1 < total_tracks:
+                        cmd += ['-t', f'{(starts[i + 1] - starts[i]) / 1000:.3f}']
+                    cmd += ['-map', '0:a:0', '-c:a', 'flac', '-compression_level', '5', '-f', 'flac', part_path]
+                    _run_ffmpeg(cmd)
+                    _commit_output(part_path, output_path)
+                    
+                except Exception as e:
+                    if part_path and os.path.exists(part_path):
+                        os.remove(part_path)
+                    self.failed_files.append(f"Track {track.get('number', 'unknown')}: {str(e)}")
+                    errors.append(f"Track {track.get('number', 'unknown')} - {str(e)}\n{traceback.format_exc()}\n")
+                
+                self.progress.emit(i + 1, total_tracks)
+        
+        except Exception as e:
+            self.failed_files.append(f"General error: {str(e)}")
+            errors.append(f"General error - {str(e)}\n{traceback.format_exc()}\n")
+        
+        _write_error_log('cue_split_errors.log', errors)
+        self.finished.emit(self.failed_files)
+
+class ConverterApp(QWidget):
+    def __init__(self, has_horizon=False):
+        super().__init__()
+        self.has_horizon = has_horizon
+        self.last_progress_update = 0.0
+        self.initUI()
+
+    def initUI(self):
+        self.setWindowTitle('Music Converter')
+        self.setGeometry(100, 100, 400, 450 if self.has_horizon else 400)
+
+        layout = QVBoxLayout()
+
+        self.label = QLabel('Select a folder containing .m4a, .flac, and .wv files to convert:')
+        layout.addWidget(self.label)
+
+        self.button = QPushButton('Select Folder')
+        self.button.clicked.connect(self.select_folder)
+        layout.addWidget(self.button)
+
+        self.file_type_layout = QHBoxLayout()
+        self.m4a_checkbox = QCheckBox('.m4a')
+        self.m4a_checkbox.setChecked(True)
+        self.file_type_layout.addWidget(self.m4a_checkbox)
+        self.flac_checkbox = QCheckBox('.flac')
+        self.flac_checkbox.setChecked(True)
+        self.file_type_layout.addWidget(self.flac_checkbox)
+        self.wv_checkbox = QCheckBox('.wv')
+        self.wv_checkbox.setChecked(True)
+        self.file_type_layout.addWidget(self.wv_checkbox)
+        layout.addLayout(self.file_type_layout)
+
+        self.overwrite_checkbox = QCheckBox('Overwrite original files')
+        layout.addWidget(self.overwrite_checkbox)
+
+        self.destination_button = QPushButton('Select Destination Folder')
+        self.destination_button.clicked.connect(self.select_destination_folder)
+        layout.addWidget(self.destination_button)
+
+        self.bitrate_label = QLabel('Select Bitrate:')
+        layout.addWidget(self.bitrate_label)
+        self.bitrate_combo = QComboBox()
+        self.bitrate_combo.addItems(['128k', '192k', '320k'])
+        layout.addWidget(self.bitrate_combo)
+
+        self.sample_rate_label = QLabel('Select Sample Rate:')
+        layout.addWidget(self.sample_rate_label)
+        self.sample_rate_combo = QComboBox()
+        self.sample_rate_combo.addItems(['22050', '44100', '48000'])
+        layout.addWidget(self.sample_rate_combo)
+
+        if self.has_horizon:
+            self.gamma_horizon_checkbox = QCheckBox('Convert to Gamma Horizon Specifications')
+            layout.addWidget(self.gamma_horizon_checkbox)
+
+        self.convert_button = QPushButton('Convert')
+        self.convert_button.clicked.connect(self.convert_files)
+        layout.addWidget(self.convert_button)
+
+        self.cue_split_button = QPushButton('Split Audio with Cue Sheet')
+        self.cue_split_button.clicked.connect(self.split_with_cue)
+        layout.addWidget(self.cue_split_button)
+
+        self.progress = QProgressBar()
+        self.progress.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.progress)
+
+        self.failed_files_label = QLabel('Failed Files:')
+        layout.addWidget(self.failed_files_label)
+        self.failed_files_text = QTextEdit()
+        self.failed_files_text.setReadOnly(True)
+        layout.addWidget(self.failed_files_text)
+
+        self.setLayout(layout)
+
+    def select_folder(self):
+        self.folder = QFileDialog.getExistingDirectory(self, 'Select Folder')
+        if self.folder:
+            self.label.setText(f'Selected Folder: {self.folder}')
+
+    def select_destination_folder(self):
+        self.destination_folder = QFileDialog.getExistingDirectory(self, 'Select Destination Folder')
+        if self.destination_folder:
+            self.label.setText(f'Selected Destination Folder: {self.destination_folder}')
+
+    def split_with_cue(self):
+        cue_file, _ = QFileDialog.getOpenFileName(self, 'Select Cue File', '', 'Cue Files (*.cue)')
+        if cue_file:
+            audio_file, _ = QFileDialog.getOpenFileName(
+                self, 'Select Audio File', 
+                os.path.dirname(cue_file),
+                'Audio Files (*.flac *.wv)'
+            )
+            if audio_file:
+                output_folder = QFileDialog.getExistingDirectory(self, 'Select Output Folder')
+                if output_folder:
+                    self.thread = CueSplitterThread(cue_file, audio_file, output_folder)
+                    self.thread.progress.connect(self.update_progress)
+                    self.thread.finished.connect(self.cue_split_finished)
+                    self.thread.start()
+
+    def convert_files(self):
+        if hasattr(self, 'folder'):
+            overwrite = self.overwrite_checkbox.isChecked()
+            file_types = []
+            if self.m4a_checkbox.isChecked():
+                file_types.append('.m4a')
+            if self.flac_checkbox.isChecked():
+                file_types.append('.flac')
+            if self.wv_checkbox.isChecked():
+                file_types.append('.wv')
+            self.conversion_opts = {
+                'folder': self.folder,
+                'overwrite': overwrite,
+                'destination_folder': getattr(self, 'destination_folder', None),
+                'bitrate': self.bitrate_combo.currentText(),
+                'sample_rate': int(self.sample_rate_combo.currentText()),
+                'gamma_horizon': self.has_horizon and self.gamma_horizon_checkbox.isChecked(),
+                'created_dirs': set(),
+                'claimed_outputs': {},
+                'claim_lock': threading.Lock(),
+            }
+            # Resume an interrupted run from the manifest in the output root
+            output_root = self.folder if overwrite else self.conversion_opts['destination_folder']
+            self.manifest = None
+            if output_root:
+                settings = [self.conversion_opts[key] for key in ('overwrite', 'bitrate', 'sample_rate', 'gamma_horizon')]
+                try:
+                    self.manifest = ConversionManifest(output_root, settings)
+                except OSError:
+                    pass
+            skip = self.manifest.completed if self.manifest else set()
+            # All run state lives on the app, so only one conversion may run
+            # at a time; conversion_finished turns the button back on
+            self.convert_button.setEnabled(False)
+            self.pool = QThreadPool.globalInstance()
+            # Leave a core for the GUI thread
+            self.pool.setMaxThreadCount(max(1, QThread.idealThreadCount() - 1))
+            # The total is unknown until the scan is done, so show a busy bar
+            self.total_files = None
+            self.done_files = 0
+            self.failed_files = []
+            self.conversion_errors = []
+            self.progress.setRange(0, 0)
+            self.convert_signals = ConvertSignals()
+            self.convert_signals.batch_done.connect(self.batch_converted)
+            self.scan_signals = ScanSignals()
+            self.scan_signals.found.connect(self.start_conversion_task)
+            self.scan_signals.finished.connect(self.scan_finished)
+            # The scan gets its own single-thread pool so it never holds one of
+            # the conversion slots (on a 2-core machine that is the only one)
+            if not hasattr(self, 'scan_pool'):
+                self.scan_pool = QThreadPool(self)
+                self.scan_pool.setMaxThreadCount(1)
+            # Bound how far the scan can run ahead of the conversions so a huge
+            # tree never sits in the pool's queue all at once
+            self.batch_slots = threading.Semaphore(_QUEUED_BATCHES_PER_THREAD * self.pool.maxThreadCount())
+            self.scan_task = ScanTask(self.folder, file_types, skip, self.pool.maxThreadCount(),
+                                      self.batch_slots, self.scan_signals)
+            self.scan_pool.start(self.scan_task)
+
+    def start_conversion_task(self, files):
+        self.pool.start(ConvertTask(files, self.conversion_opts, self.convert_signals))
+
+    def scan_finished(self, total_files):
+        self.total_files = total_files
+        self.progress.setRange(0, 100)
+        # Make sure the bar leaves its busy state right away
+        self.last_progress_update = 0.0
+        self.batch_converted([])
+
+    def batch_converted(self, results):
+        # Runs in the GUI thread, so the plain counters need no locking.
+        # Every real batch has results; the empty call comes from scan_finished.
+        if results:
+            self.batch_slots.release()
+        for file_path, error in results:
+            if error:
+                self.failed_files.append(file_path)
+                self.conversion_errors.append(error)
+        if self.manifest:
+            self.manifest.record([file_path for file_path, error in results if not error])
+        self.done_files += len(results)
+        if self.total_files is None:
+            return
+        if self.total_files:
+            self.update_progress(self.done_files, self.total_files)
+        if self.done_files == self.total_files:
+            _write_error_log('conversion_errors.log', self.conversion_errors)
+            if self.manifest:
+                self.manifest.close()
+                self.manifest = None
+            self.conversion_finished(self.failed_files)
+
+    def closeEvent(self, event):
+        # A scan waiting for a free batch slot would otherwise block the scan
+        # pool from shutting down
+        if hasattr(self, 'scan_task'):
+            self.scan_task.stopped = True
+        super().closeEvent(event)
+
+    def update_progress(self, done, total):
+        # Redrawing for every finished batch is wasted GUI-thread work when the
+        # files are small, so update at most every 50 ms plus the final value
+        now = time.monotonic()
+        if done < total and now - self.last_progress_update < 0.05:
+            return
+        self.last_progress_update = now
+        self.progress.setRange(0, total)
+        self.progress.setValue(done)
+
+    def conversion_finished(self, failed_files):
+        self.label.setText('Conversion Finished!')
+        self.convert_button.setEnabled(True)
+        self.progress.setValue(self.progress.maximum())
+        if failed_files:
+            self.failed_files_text.setPlainText('\n'.join(failed_files))
+        else:
+            self.failed_files_text.setPlainText('No files failed.')
+
+    def cue_split_finished(self, failed_files):
+        self.label.setText('Cue Split Finished!')
+        self.progress.setValue(self.progress.maximum())
+        if failed_files:
+            self.failed_files_text.setPlainText('\n'.join(failed_files))
+        else:
+            self.failed_files_text.setPlainText('All tracks split successfully.')
+
+# Entry point shared by audioconv.py and audioconv-withhorizon.py; the scripts
+# only differ in which optional features they switch on
+def main(has_horizon=False):
+    app = QApplication([])
+    converter = ConverterApp(has_horizon=has_horizon)
+    converter.show()
+    app.exec()
+